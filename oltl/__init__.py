@@ -28,6 +28,7 @@ from .core import (
     StringT,
     Timestamp,
     TrimmedStringMixIn,
+    TrustedBaseModel,
     UpperBoundFloatMixIn,
     UpperBoundIntegerMixIn,
     json_schema_to_model,
@@ -40,6 +41,7 @@ __all__ = [
     "Timestamp",
     "__version__",
     "BaseModel",
+    "TrustedBaseModel",
     "BaseEntity",
     "BaseFloat",
     "BaseInteger",
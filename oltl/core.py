@@ -1,12 +1,33 @@
+import json
 import re
-from base64 import standard_b64decode, standard_b64encode
+import sys
+import time
+from binascii import a2b_base64, b2a_base64
 from datetime import datetime as _datetime
+from datetime import timedelta as _timedelta
 from datetime import timezone as _timezone
+from functools import lru_cache
+from graphlib import CycleError, TopologicalSorter
 from types import MappingProxyType
-from typing import Any, Dict, Generic, Literal, Sequence, Type, TypeVar, Union, cast
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+from weakref import WeakValueDictionary
 
 import ulid
-from dateutil.parser import parse as parse_datetime
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import (
     ConfigDict,
@@ -21,7 +42,6 @@ from pydantic import (
 )
 from pydantic.alias_generators import to_camel, to_snake
 from pydantic.json_schema import JsonSchemaValue
-from pydantic.main import IncEx
 from pydantic_core import core_schema
 from ulid import ULID
 
@@ -32,6 +52,7 @@ BytesT = TypeVar("BytesT", bound="BaseBytes")
 IntegerT = TypeVar("IntegerT", bound="BaseInteger")
 FloatT = TypeVar("FloatT", bound="BaseFloat")
 IdT = TypeVar("IdT", bound="Id")
+TrustedModelT = TypeVar("TrustedModelT", bound="TrustedBaseModel")
 JsonAcceptable = Union[str, int, float, bool, None, dict[str, "JsonAcceptable"], list["JsonAcceptable"]]
 NewOrExistingFilePath = Union[FilePath, NewPath]
 NewOrExistingDirectoryPath = Union[DirectoryPath, NewPath]
@@ -61,10 +82,14 @@ class BaseBytes(bytes):
     {'properties': {'value': {'format': 'base64EncodedString', 'title': 'Value', 'type': 'string'}}, 'required': ['value'], 'title': 'TestBytes', 'type': 'object'}
     """  # noqa: E501
 
+    __slots__ = ()
+
     def __new__(cls, value: Union[bytes, str]) -> "BaseBytes":
+        if type(value) is cls:
+            return value
         if isinstance(value, bytes):
             return super(BaseBytes, cls).__new__(cls, value)
-        return super(BaseBytes, cls).__new__(cls, standard_b64decode(value))
+        return super(BaseBytes, cls).__new__(cls, a2b_base64(value))
 
     @classmethod
     def __get_pydantic_core_schema__(cls, _source_type: Any, _handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
@@ -75,6 +100,9 @@ class BaseBytes(bytes):
 
     @classmethod
     def validate(cls: Type[BytesT], value: Any) -> BytesT:
+        value_type = type(value)
+        if value_type is bytes or value_type is str:
+            return cls(value)
         if isinstance(value, cls):
             return value
         if isinstance(value, (bytes, str)):
@@ -82,7 +110,7 @@ class BaseBytes(bytes):
         raise ValueError(f"Cannot convert {value} to {cls.__name__}")
 
     def serialize(self) -> JsonAcceptable:
-        return standard_b64encode(self).decode()
+        return b2a_base64(self, newline=False).decode("ascii")
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({super().__repr__()})"
@@ -95,6 +123,10 @@ class BaseString(str):
     """
     BaseString is a string type that can be used to validate and serialize strings.
 
+    String processing is composed from ``_proc_str_step`` classmethods, applied in MRO order. Every class that
+    defines one contributes a step, so redefining ``_proc_str_step`` in a subclass adds a step rather than
+    replacing the inherited one. Override ``_proc_str`` to replace the processing instead.
+
     >>> BaseString("test")
     BaseString('test')
     >>> str(BaseString("test"))
@@ -105,11 +137,13 @@ class BaseString(str):
     >>> ta.validate_python(1)
     Traceback (most recent call last):
      ...
-    pydantic_core._pydantic_core.ValidationError: 1 validation error for function-after[BaseString(), function-before[_proc_str(), str]]
+    pydantic_core._pydantic_core.ValidationError: 1 validation error for function-after[BaseString(), str]
       Input should be a valid string [type=string_type, input_value=1, input_type=int]
      ...
     >>> ta.dump_json(BaseString("test_test"))
     b'"test_test"'
+    >>> BaseString("test").serialize()
+    'test'
     >>> BaseString.from_str("test")
     BaseString('test')
     >>> ta.validate_python(BaseString.from_str("test"))
@@ -120,25 +154,59 @@ class BaseString(str):
     BaseString('test　test')
     """  # noqa: E501
 
+    __slots__ = ()
+    _type_adapter: ClassVar[Optional[TypeAdapter[Any]]] = None
+    _list_type_adapter: ClassVar[Optional[TypeAdapter[Any]]] = None
+    _extra_constraint_dict: ClassVar[Optional[MappingProxyType[str, Any]]] = None
+    _core_schema: ClassVar[Optional[core_schema.CoreSchema]] = None
+    _has_proc: ClassVar[bool] = False
+    _has_default_core_schema: ClassVar[bool] = True
+    _proc_str_steps: ClassVar[Tuple[Callable[[str], str], ...]] = ()
+    _repr_prefix: ClassVar[str] = "BaseString("
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._repr_prefix = cls.__name__ + "("
+        cls._type_adapter = None
+        cls._list_type_adapter = None
+        cls._extra_constraint_dict = None
+        cls._core_schema = None
+        subclasses = cls.__mro__[: cls.__mro__.index(BaseString)]
+        cls._proc_str_steps = tuple(
+            vars(klass)["_proc_str_step"].__get__(None, cls) for klass in subclasses if "_proc_str_step" in vars(klass)
+        )
+        cls._has_proc = bool(cls._proc_str_steps) or any("_proc_str" in vars(klass) for klass in subclasses)
+        cls._has_default_core_schema = not any("__get_pydantic_core_schema__" in vars(klass) for klass in subclasses)
+
     @classmethod
     def _proc_str(cls, s: str) -> str:
+        for step in cls._proc_str_steps:
+            s = step(s)
+        return s
+
+    @classmethod
+    def _check_str(cls, s: str) -> str:
         return s
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({super().__repr__()})"
+        return self._repr_prefix + super().__repr__() + ")"
 
-    def __str__(self) -> str:
-        return super(BaseString, self).__str__()
+    __str__ = str.__str__
 
     @classmethod
     def __get_pydantic_core_schema__(cls, _source_type: Any, _handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
-        return core_schema.no_info_after_validator_function(
-            cls,
-            core_schema.no_info_before_validator_function(
-                cls._proc_str, core_schema.str_schema(**cls.__get_extra_constraint_dict__())
-            ),
-            serialization=core_schema.plain_serializer_function_ser_schema(cls.serialize, when_used="json"),
-        )
+        if cls._core_schema is None:
+            schema = core_schema.str_schema(**cls._get_extra_constraint_dict())
+            cls._core_schema = core_schema.no_info_after_validator_function(
+                cls,
+                core_schema.no_info_before_validator_function(cls._proc_str, schema) if cls._has_proc else schema,
+                serialization=(
+                    None
+                    if cls.serialize is BaseString.serialize
+                    else core_schema.plain_serializer_function_ser_schema(cls.serialize, when_used="json")
+                ),
+            )
+        return cast(core_schema.CoreSchema, dict(cls._core_schema))
 
     def serialize(self) -> JsonAcceptable:
         return str(self)
@@ -147,12 +215,88 @@ class BaseString(str):
     def __get_extra_constraint_dict__(cls) -> dict[str, Any]:
         return {}
 
-    def __hash__(self) -> int:
-        return super(BaseString, self).__hash__()
+    @classmethod
+    def _get_extra_constraint_dict(cls) -> MappingProxyType[str, Any]:
+        if cls._extra_constraint_dict is None:
+            cls._extra_constraint_dict = MappingProxyType(cls.__get_extra_constraint_dict__())
+        return cls._extra_constraint_dict
+
+    __hash__ = str.__hash__
 
     @classmethod
     def from_str(cls: Type[StringT], v: str) -> StringT:
-        return TypeAdapter(cls).validate_python(v)
+        if type(v) is cls:
+            return v
+        if type(v) is str and cls._has_default_core_schema and not cls._get_extra_constraint_dict():
+            return cls.from_trusted_str(v)
+        if cls._type_adapter is None:
+            cls._type_adapter = TypeAdapter(cls)
+        return cast(StringT, cls._type_adapter.validate_python(v))
+
+    @classmethod
+    def from_trusted_str(cls: Type[StringT], v: str) -> StringT:
+        """
+        Apply the string processing of the class but skip its constraints. Only for data that already passed validate.
+
+        >>> class TestString(SnakeCaseStringMixIn, NonEmptyStringMixIn):
+        ...   ...
+        >>> TestString.from_trusted_str("testTest")
+        TestString('test_test')
+        >>> TestString.from_trusted_str("")
+        TestString('')
+        """
+        return cls(cls._proc_str(v) if cls._has_proc else v)
+
+    @classmethod
+    def from_strs(cls: Type[StringT], values: Iterable[str]) -> list[StringT]:
+        """
+        Validate many strings at once; pydantic-core iterates the values instead of a Python loop.
+
+        >>> class NonEmptyString(NonEmptyStringMixIn):
+        ...   ...
+        >>> NonEmptyString.from_strs(["a", "b"])
+        [NonEmptyString('a'), NonEmptyString('b')]
+        """
+        if cls._list_type_adapter is None:
+            cls._list_type_adapter = TypeAdapter(list[cls])  # type: ignore[valid-type]
+        return cast(list[StringT], cls._list_type_adapter.validate_python(list(values)))
+
+    @classmethod
+    def unchecked(cls: Type[StringT], v: str) -> StringT:
+        """
+        Build an instance without validation. Unsafe: only for data that already passed validate.
+
+        >>> class NonEmptyString(NonEmptyStringMixIn):
+        ...   ...
+        >>> NonEmptyString.unchecked("")
+        NonEmptyString('')
+        """
+        return str.__new__(cls, v)
+
+    @classmethod
+    def check(cls: Type[StringT], v: str) -> StringT:
+        """
+        Validate in plain Python, without a pydantic-core round-trip.
+        Only the constraints contributed by the mixins in this module are checked.
+
+        >>> class NonEmptyString(NonEmptyStringMixIn):
+        ...   ...
+        >>> NonEmptyString.check("test")
+        NonEmptyString('test')
+        >>> NonEmptyString.check("")
+        Traceback (most recent call last):
+         ...
+        ValueError: String should have at least 1 character
+        >>> NonEmptyString.check(1)
+        Traceback (most recent call last):
+         ...
+        ValueError: Input should be a valid string
+        """
+        if not isinstance(v, str):
+            raise ValueError("Input should be a valid string")
+        if cls._has_proc:
+            v = cls._proc_str(v)
+        return str.__new__(cls, cls._check_str(v))
 
 
 class LimitedMinLengthStringMixIn(BaseString):
@@ -171,17 +315,19 @@ class LimitedMinLengthStringMixIn(BaseString):
     >>> ta.validate_python("te")
     Traceback (most recent call last):
      ...
-    pydantic_core._pydantic_core.ValidationError: 1 validation error for function-after[TestString(), function-before[_proc_str(), constrained-str]]
+    pydantic_core._pydantic_core.ValidationError: 1 validation error for function-after[TestString(), constrained-str]
       String should have at least 3 characters [type=string_too_short, input_value='te', input_type=str]
      ...
     >>> ta.validate_python("t")
     Traceback (most recent call last):
      ...
-    pydantic_core._pydantic_core.ValidationError: 1 validation error for function-after[TestString(), function-before[_proc_str(), constrained-str]]
+    pydantic_core._pydantic_core.ValidationError: 1 validation error for function-after[TestString(), constrained-str]
       String should have at least 3 characters [type=string_too_short, input_value='t', input_type=str]
      ...
     """  # noqa: E501
 
+    __slots__ = ()
+
     @classmethod
     def get_min_length(cls) -> int:
         raise NotImplementedError
@@ -190,6 +336,14 @@ class LimitedMinLengthStringMixIn(BaseString):
     def __get_extra_constraint_dict__(cls) -> dict[str, Any]:
         return super().__get_extra_constraint_dict__() | {"min_length": cls.get_min_length()}
 
+    @classmethod
+    def _check_str(cls, s: str) -> str:
+        s = super()._check_str(s)
+        min_length = cls._get_extra_constraint_dict()["min_length"]
+        if len(s) < min_length:
+            raise ValueError(f"String should have at least {min_length} character{'' if min_length == 1 else 's'}")
+        return s
+
 
 class NonEmptyStringMixIn(LimitedMinLengthStringMixIn, metaclass=type):
     """
@@ -204,11 +358,13 @@ class NonEmptyStringMixIn(LimitedMinLengthStringMixIn, metaclass=type):
     >>> ta.validate_python("")
     Traceback (most recent call last):
      ...
-    pydantic_core._pydantic_core.ValidationError: 1 validation error for function-after[NonEmptyString(), function-before[_proc_str(), constrained-str]]
+    pydantic_core._pydantic_core.ValidationError: 1 validation error for function-after[NonEmptyString(), constrained-str]
       String should have at least 1 character [type=string_too_short, input_value='', input_type=str]
      ...
     """  # noqa: E501
 
+    __slots__ = ()
+
     @classmethod
     def get_min_length(cls) -> int:
         return 1
@@ -228,13 +384,15 @@ class LimitedMaxLengthStringMixIn(BaseString):
     >>> ta.validate_python("test")
     Traceback (most recent call last):
      ...
-    pydantic_core._pydantic_core.ValidationError: 1 validation error for function-after[TestString(), function-before[_proc_str(), constrained-str]]
+    pydantic_core._pydantic_core.ValidationError: 1 validation error for function-after[TestString(), constrained-str]
       String should have at most 3 characters [type=string_too_long, input_value='test', input_type=str]
      ...
     >>> ta.validate_python("te")
     TestString('te')
     """  # noqa: E501
 
+    __slots__ = ()
+
     @classmethod
     def get_max_length(cls) -> int:
         raise NotImplementedError
@@ -243,6 +401,20 @@ class LimitedMaxLengthStringMixIn(BaseString):
     def __get_extra_constraint_dict__(cls) -> dict[str, Any]:
         return super().__get_extra_constraint_dict__() | {"max_length": cls.get_max_length()}
 
+    @classmethod
+    def _check_str(cls, s: str) -> str:
+        s = super()._check_str(s)
+        max_length = cls._get_extra_constraint_dict()["max_length"]
+        if len(s) > max_length:
+            raise ValueError(f"String should have at most {max_length} character{'' if max_length == 1 else 's'}")
+        return s
+
+
+_STR_CACHE_MAX_LENGTH = 128
+_normalize_jptext_cached = lru_cache(maxsize=4096)(normalize_jptext)
+_to_snake_cached = lru_cache(maxsize=4096)(to_snake)
+_to_camel_cached = lru_cache(maxsize=4096)(to_camel)
+
 
 class NormalizedStringMixIn(BaseString):
     """
@@ -259,9 +431,11 @@ class NormalizedStringMixIn(BaseString):
     TestString('test test')
     """
 
+    __slots__ = ()
+
     @classmethod
-    def _proc_str(cls, s: str) -> str:
-        return super()._proc_str(normalize_jptext(s))
+    def _proc_str_step(cls, s: str) -> str:
+        return _normalize_jptext_cached(s) if len(s) <= _STR_CACHE_MAX_LENGTH else normalize_jptext(s)
 
 
 class RegexSubstitutedStringMixIn(BaseString):
@@ -289,6 +463,13 @@ class RegexSubstitutedStringMixIn(BaseString):
     TypeError: 'mappingproxy' object does not support item assignment
     """
 
+    __slots__ = ()
+    _compiled_subs: ClassVar[Optional[Tuple[Tuple["re.Pattern[str]", str], ...]]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._compiled_subs = None
+
     @classmethod
     def get_pattern(cls) -> str:
         raise NotImplementedError
@@ -302,10 +483,22 @@ class RegexSubstitutedStringMixIn(BaseString):
         return MappingProxyType({cls.get_pattern(): cls.get_repl()})
 
     @classmethod
-    def _proc_str(cls, s: str) -> str:
-        for pattern, repl in cls.get_pattern_to_repl_map().items():
-            s = re.sub(pattern, repl, s)
-        return super()._proc_str(s)
+    def _get_compiled_subs(cls) -> Tuple[Tuple["re.Pattern[str]", str], ...]:
+        if cls._compiled_subs is None:
+            cls._compiled_subs = tuple(
+                (re.compile(pattern), repl) for pattern, repl in cls.get_pattern_to_repl_map().items()
+            )
+        return cls._compiled_subs
+
+    @classmethod
+    def _proc_str_step(cls, s: str) -> str:
+        compiled_subs = cls._get_compiled_subs()
+        if len(compiled_subs) == 1:
+            pattern, repl = compiled_subs[0]
+            return pattern.sub(repl, s)
+        for pattern, repl in compiled_subs:
+            s = pattern.sub(repl, s)
+        return s
 
 
 class RegexMatchedStringMixIn(BaseString):
@@ -324,11 +517,18 @@ class RegexMatchedStringMixIn(BaseString):
     >>> ta.validate_python("test_test")
     Traceback (most recent call last):
      ...
-    pydantic_core._pydantic_core.ValidationError: 1 validation error for function-after[TestString(), function-before[_proc_str(), constrained-str]]
+    pydantic_core._pydantic_core.ValidationError: 1 validation error for function-after[TestString(), constrained-str]
       String should match pattern '^[a-z]+$' [type=string_pattern_mismatch, input_value='test_test', input_type=str]
      ...
     """  # noqa: E501
 
+    __slots__ = ()
+    _compiled_pattern: ClassVar[Optional["re.Pattern[str]"]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._compiled_pattern = None
+
     @classmethod
     def get_pattern(cls) -> str:
         raise NotImplementedError
@@ -337,6 +537,27 @@ class RegexMatchedStringMixIn(BaseString):
     def __get_extra_constraint_dict__(cls) -> dict[str, Any]:
         return super().__get_extra_constraint_dict__() | {"pattern": cls.get_pattern()}
 
+    @classmethod
+    def _get_compiled_pattern(cls) -> "re.Pattern[str]":
+        if cls._compiled_pattern is None:
+            cls._compiled_pattern = re.compile(cls._get_extra_constraint_dict()["pattern"])
+        return cls._compiled_pattern
+
+    @classmethod
+    def _check_str(cls, s: str) -> str:
+        s = super()._check_str(s)
+        compiled_pattern = cls._get_compiled_pattern()
+        if compiled_pattern.search(s) is None:
+            raise ValueError(f"String should match pattern '{compiled_pattern.pattern}'")
+        return s
+
+
+# Unicode White_Space, the set pydantic-core's strip_whitespace trims; bare str.strip() also drops U+001C..U+001F.
+_UNICODE_WHITESPACE = (
+    "\t\n\x0b\x0c\r \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
+
 
 class TrimmedStringMixIn(BaseString):
     """
@@ -353,10 +574,16 @@ class TrimmedStringMixIn(BaseString):
     TestString('test')
     """
 
+    __slots__ = ()
+
     @classmethod
     def __get_extra_constraint_dict__(cls) -> dict[str, Any]:
         return super().__get_extra_constraint_dict__() | {"strip_whitespace": True}
 
+    @classmethod
+    def _check_str(cls, s: str) -> str:
+        return super()._check_str(s.strip(_UNICODE_WHITESPACE))
+
 
 class SnakeCaseStringMixIn(BaseString):
     """
@@ -375,9 +602,11 @@ class SnakeCaseStringMixIn(BaseString):
     TestString('test_test')
     """
 
+    __slots__ = ()
+
     @classmethod
-    def _proc_str(cls, s: str) -> str:
-        return super()._proc_str(to_snake(s))
+    def _proc_str_step(cls, s: str) -> str:
+        return _to_snake_cached(s) if len(s) <= _STR_CACHE_MAX_LENGTH else to_snake(s)
 
 
 class CamelCaseStringMixIn(BaseString):
@@ -397,9 +626,11 @@ class CamelCaseStringMixIn(BaseString):
     TestString('alreadyCamelCasedWontBeLowerCased')
     """
 
+    __slots__ = ()
+
     @classmethod
-    def _proc_str(cls, s: str) -> str:
-        return super()._proc_str(to_camel(s))
+    def _proc_str_step(cls, s: str) -> str:
+        return _to_camel_cached(s) if len(s) <= _STR_CACHE_MAX_LENGTH else to_camel(s)
 
 
 class BaseInteger(int):
@@ -425,17 +656,23 @@ class BaseInteger(int):
     True
     """  # noqa: E501
 
+    __slots__ = ()
+    _extra_constraint_dict: ClassVar[Optional[MappingProxyType[str, Any]]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._extra_constraint_dict = None
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({super().__repr__()})"
 
-    def __str__(self) -> str:
-        return super(BaseInteger, self).__str__()
+    __str__ = int.__str__
 
     @classmethod
     def __get_pydantic_core_schema__(cls, _source_type: Any, _handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
         return core_schema.no_info_after_validator_function(
             cls.validate,
-            core_schema.int_schema(**cls.__get_extra_constraint_dict__()),
+            core_schema.int_schema(**cls._get_extra_constraint_dict()),
             serialization=core_schema.plain_serializer_function_ser_schema(cls.serialize, when_used="json"),
         )
 
@@ -444,6 +681,8 @@ class BaseInteger(int):
 
     @classmethod
     def validate(cls: Type[IntegerT], value: Any) -> IntegerT:
+        if type(value) is int:
+            return cls(value)
         if isinstance(value, cls):
             return value
         if isinstance(value, int):
@@ -457,8 +696,13 @@ class BaseInteger(int):
     def __get_extra_constraint_dict__(cls) -> dict[str, Any]:
         return {}
 
-    def __hash__(self) -> int:
-        return super(BaseInteger, self).__hash__()
+    @classmethod
+    def _get_extra_constraint_dict(cls) -> MappingProxyType[str, Any]:
+        if cls._extra_constraint_dict is None:
+            cls._extra_constraint_dict = MappingProxyType(cls.__get_extra_constraint_dict__())
+        return cls._extra_constraint_dict
+
+    __hash__ = int.__hash__
 
 
 class LowerBoundIntegerMixIn(BaseInteger):
@@ -483,6 +727,8 @@ class LowerBoundIntegerMixIn(BaseInteger):
      ...
     """  # noqa: E501
 
+    __slots__ = ()
+
     @classmethod
     def get_min_value(cls) -> int:
         raise NotImplementedError
@@ -514,6 +760,8 @@ class UpperBoundIntegerMixIn(BaseInteger):
      ...
     """  # noqa: E501
 
+    __slots__ = ()
+
     @classmethod
     def get_max_value(cls) -> int:
         raise NotImplementedError
@@ -546,17 +794,23 @@ class BaseFloat(float):
     True
     """  # noqa: E501
 
+    __slots__ = ()
+    _extra_constraint_dict: ClassVar[Optional[MappingProxyType[str, Any]]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._extra_constraint_dict = None
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({super().__repr__()})"
 
-    def __str__(self) -> str:
-        return super(BaseFloat, self).__str__()
+    __str__ = float.__str__
 
     @classmethod
     def __get_pydantic_core_schema__(cls, _source_type: Any, _handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
         return core_schema.no_info_after_validator_function(
             cls.validate,
-            core_schema.float_schema(**cls.__get_extra_constraint_dict__()),
+            core_schema.float_schema(**cls._get_extra_constraint_dict()),
             serialization=core_schema.plain_serializer_function_ser_schema(cls.serialize, when_used="json"),
         )
 
@@ -565,6 +819,8 @@ class BaseFloat(float):
 
     @classmethod
     def validate(cls: Type[FloatT], value: Any) -> FloatT:
+        if type(value) is float:
+            return cls(value)
         if isinstance(value, cls):
             return value
         if isinstance(value, float):
@@ -578,8 +834,13 @@ class BaseFloat(float):
     def __get_extra_constraint_dict__(cls) -> dict[str, Any]:
         return {}
 
-    def __hash__(self) -> int:
-        return super(BaseFloat, self).__hash__()
+    @classmethod
+    def _get_extra_constraint_dict(cls) -> MappingProxyType[str, Any]:
+        if cls._extra_constraint_dict is None:
+            cls._extra_constraint_dict = MappingProxyType(cls.__get_extra_constraint_dict__())
+        return cls._extra_constraint_dict
+
+    __hash__ = float.__hash__
 
 
 class LowerBoundFloatMixIn(BaseFloat):
@@ -604,6 +865,8 @@ class LowerBoundFloatMixIn(BaseFloat):
      ...
     """  # noqa: E501
 
+    __slots__ = ()
+
     @classmethod
     def get_min_value(cls) -> float:
         raise NotImplementedError
@@ -635,6 +898,8 @@ class UpperBoundFloatMixIn(BaseFloat):
      ...
     """  # noqa: E501
 
+    __slots__ = ()
+
     @classmethod
     def get_max_value(cls) -> float:
         raise NotImplementedError
@@ -644,6 +909,59 @@ class UpperBoundFloatMixIn(BaseFloat):
         return super().__get_extra_constraint_dict__() | {"le": cls.get_max_value()}
 
 
+def _ulid_buffer_from_ulid(value: ULID) -> bytes:
+    return value.bytes
+
+
+def _ulid_buffer_from_bytes(value: bytes) -> bytes:
+    return value
+
+
+def _build_crockford_base32_digit_table() -> bytes:
+    table = bytearray(b"!" * 256)
+    for digit, char in zip("0123456789abcdefghijklmnopqrstuv", "0123456789ABCDEFGHJKMNPQRSTVWXYZ"):
+        table[ord(char)] = table[ord(char.lower())] = ord(digit)
+    for alias, char in (("I", "1"), ("L", "1"), ("O", "0")):
+        table[ord(alias)] = table[ord(alias.lower())] = ord(char)
+    return bytes(table)
+
+
+_CROCKFORD_BASE32_DIGIT_TABLE = _build_crockford_base32_digit_table()
+
+
+@lru_cache(maxsize=4096)
+def _ulid_buffer_from_str(value: str) -> bytes:
+    if len(value) != 26:
+        raise ValueError(f"Invalid ULID string: {value}")
+    try:
+        return int(value.encode("ascii").translate(_CROCKFORD_BASE32_DIGIT_TABLE), 32).to_bytes(16, "big")
+    except (ValueError, OverflowError) as e:
+        raise ValueError(f"Invalid ULID string: {value}") from e
+
+
+_ULID_BUFFER_CONVERTERS: Dict[type, Callable[[Any], bytes]] = {
+    ULID: _ulid_buffer_from_ulid,
+    bytes: _ulid_buffer_from_bytes,
+    str: _ulid_buffer_from_str,
+}
+
+
+def _to_ulid_buffer(value: Union[str, ULID, bytes]) -> bytes:
+    converter = _ULID_BUFFER_CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
+    if isinstance(value, ULID):
+        return _ulid_buffer_from_ulid(value)
+    if isinstance(value, bytes):
+        return _ulid_buffer_from_bytes(value)
+    if isinstance(value, str):
+        return _ulid_buffer_from_str(value)
+    raise ValueError(f"Invalid ULID string: {value}")
+
+
+_INTERNED_IDS: WeakValueDictionary[Tuple[type, str], "Id"] = WeakValueDictionary()
+
+
 class Id(ULID):
     r"""Id is a string type that can be used to validate and serialize ULID strings.
 
@@ -659,20 +977,46 @@ class Id(ULID):
     ValueError: Invalid ULID string: 01HRQ0BNKS4WMFVQPW810MP
     """
 
+    __slots__ = ("_bytes", "_str", "__weakref__")
+    _bytes: bytes
+    _str: Optional[str]
+
+    _repr_prefix: ClassVar[str] = "Id('"
+    _core_schema: ClassVar[Optional[core_schema.CoreSchema]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._repr_prefix = cls.__name__ + "('"
+        cls._core_schema = None
+
     def __init__(self, value: Union[str, ULID, bytes]) -> None:
-        if isinstance(value, ULID):
-            super(Id, self).__init__(value.bytes)
+        if isinstance(value, Id):
+            ULID.__init__(self, value._bytes)
+            self._bytes = value._bytes
+            self._str = value._str
             return
-        if isinstance(value, bytes):
-            super(Id, self).__init__(value)
-            return
-        if len(value) != 26:
-            raise ValueError(f"Invalid ULID string: {value}")
-        super(Id, self).__init__(ulid.base32.decode_ulid(value))
+        buffer = _to_ulid_buffer(value)
+        ULID.__init__(self, buffer)
+        self._bytes = buffer
+        self._str = None
 
     @classmethod
     def generate(cls: Type[IdT]) -> IdT:
-        return cls(ulid.new())
+        return cls.unchecked(ulid.new().bytes)
+
+    @classmethod
+    def unchecked(cls: Type[IdT], b: bytes) -> IdT:
+        r"""
+        Build an Id from its 16 raw bytes without validation. Unsafe: only for data that already passed validate.
+
+        >>> Id.unchecked(b"\x01\x8e.\t\xa9\x06=\x9b\x0fK\xaa\xdc'\x01\xe0;")
+        Id('01HRQ0KA867PDGYJXAVGKG3R1V')
+        """
+        obj = cls.__new__(cls)
+        ULID.__init__(obj, b)
+        obj._bytes = b
+        obj._str = None
+        return obj
 
     def serialize(self) -> str:
         """
@@ -681,29 +1025,109 @@ class Id(ULID):
         >>> Id("01HRQ0BNKS4WMFVQPW810MPM3V").serialize()
         '01HRQ0BNKS4WMFVQPW810MPM3V'
         """
-        return str(self)
+        return self.str
+
+    def __str__(self) -> str:
+        return self.str
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}('{self.str}')"
+        return self._repr_prefix + self.str + "')"
+
+    def __setstate__(self, state: str) -> None:
+        Id.__init__(self, state)
 
     @classmethod
     def validate(cls: Type[IdT], value: Any) -> IdT:
+        if type(value) is cls:
+            return value
+        if isinstance(value, str):
+            key = (cls, value)
+            interned = _INTERNED_IDS.get(key)
+            if interned is None:
+                interned = _INTERNED_IDS[key] = cls(value)
+            return cast(IdT, interned)
         if isinstance(value, cls):
             return value
-        if isinstance(value, (ULID, str)):
+        if isinstance(value, ULID):
             return cls(value)
         raise ValueError(f"Cannot convert {value} to {cls}")
 
     @classmethod
     def __get_pydantic_core_schema__(cls, _source_type: Any, _handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
-        return core_schema.no_info_plain_validator_function(
-            cls.validate,
-            serialization=core_schema.plain_serializer_function_ser_schema(cls.serialize, when_used="json"),
-        )
+        if cls._core_schema is None:
+            cls._core_schema = core_schema.no_info_plain_validator_function(
+                cls.validate,
+                serialization=core_schema.plain_serializer_function_ser_schema(cls.serialize, when_used="json"),
+            )
+        return cast(core_schema.CoreSchema, dict(cls._core_schema))
 
     def __get_pydantic_json_schema__(self, _handler: GetJsonSchemaHandler) -> JsonSchemaValue:
         return {"format": "crockfordBase32", "type": "string"}
 
+    # Defined last so the names do not shadow the builtins in the annotations above.
+    @property
+    def bytes(self) -> bytes:
+        return self._bytes
+
+    @property
+    def str(self) -> str:
+        encoded = self._str
+        if encoded is None:
+            encoded = self._str = ULID.str.fget(self)  # type: ignore[attr-defined]
+        return encoded
+
+
+_EPOCH = _datetime(1970, 1, 1, tzinfo=_timezone.utc)
+
+
+def _microseconds_from_datetime(value: _datetime) -> int:
+    if value.utcoffset() is None:
+        value = value.astimezone(_timezone.utc)
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def parse_datetime(value: str) -> _datetime:
+    # dateutil is only needed for non-ISO input, so keep it out of the import-time path.
+    from dateutil.parser import parse
+
+    return parse(value)
+
+
+def _parse_datetime_str(value: str) -> _datetime:
+    try:
+        return _datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        return parse_datetime(value)
+
+
+def _microseconds_from_str(value: str) -> int:
+    return _microseconds_from_datetime(_parse_datetime_str(value))
+
+
+def _microseconds_from_float(value: float) -> int:
+    return int(value * 1000000)
+
+
+_TIMESTAMP_CONVERTERS: Dict[type, Callable[[Any], int]] = {
+    float: _microseconds_from_float,
+    str: _microseconds_from_str,
+    _datetime: _microseconds_from_datetime,
+}
+
+
+def _to_microseconds(value: Union[int, float, _datetime, str]) -> int:
+    converter = _TIMESTAMP_CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
+    if isinstance(value, _datetime):
+        return _microseconds_from_datetime(value)
+    if isinstance(value, str):
+        return _microseconds_from_str(value)
+    if isinstance(value, float):
+        return _microseconds_from_float(value)
+    return value
+
 
 class Timestamp(int):
     """
@@ -747,17 +1171,19 @@ class Timestamp(int):
      ...
     """
 
+    __slots__ = ()
+
     def __new__(cls, value: Union[int, float, _datetime, str]) -> "Timestamp":
-        if isinstance(value, _datetime):
-            return super(Timestamp, cls).__new__(cls, int(value.timestamp() * 1000000))
-        if isinstance(value, str):
-            return super(Timestamp, cls).__new__(cls, int(parse_datetime(value).timestamp() * 1000000))
-        if isinstance(value, float):
-            return super(Timestamp, cls).__new__(cls, int(value * 1000000))
-        return super(Timestamp, cls).__new__(cls, value)
+        if type(value) is int:
+            return int.__new__(cls, value)
+        if type(value) is cls:
+            return value
+        return int.__new__(cls, _to_microseconds(value))
 
     @classmethod
     def validate(cls, v: Any) -> "Timestamp":
+        if type(v) is int:
+            return cls(v)
         if isinstance(v, cls):
             return v
         if isinstance(v, (int, float, _datetime, str)):
@@ -771,7 +1197,7 @@ class Timestamp(int):
         >>> a.milliseconds
         1674365364479
         """
-        return int(self // 1000)
+        return self // 1000
 
     @property
     def microseconds(self) -> int:
@@ -789,11 +1215,18 @@ class Timestamp(int):
         >>> a.datetime
         datetime.datetime(2023, 1, 22, 14, 29, 24, 479000, tzinfo=datetime.timezone.utc)
         """
-        return _datetime.fromtimestamp(self / 1000000, tz=_timezone.utc)
+        return _EPOCH + _timedelta(microseconds=self)
 
     @classmethod
     def now(cls) -> "Timestamp":
-        return cls(_datetime.utcnow())
+        return int.__new__(cls, time.time_ns() // 1000)
+
+    @staticmethod
+    def now_ns() -> int:
+        """
+        Current time as raw nanoseconds since the epoch, for callers that do not need a Timestamp.
+        """
+        return time.time_ns()
 
     def __repr__(self) -> str:
         return f"Timestamp({super(Timestamp, self).__repr__()})"
@@ -802,7 +1235,11 @@ class Timestamp(int):
     def __get_pydantic_core_schema__(cls, _source_type: Any, _handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
         return core_schema.no_info_plain_validator_function(
             cls.validate,
-            serialization=core_schema.plain_serializer_function_ser_schema(cls.serialize, when_used="json"),
+            serialization=(
+                core_schema.simple_ser_schema("int")
+                if cls.serialize is Timestamp.serialize
+                else core_schema.plain_serializer_function_ser_schema(cls.serialize, when_used="json")
+            ),
         )
 
     def __get_pydantic_json_schema__(self, _handler: GetJsonSchemaHandler) -> JsonSchemaValue:
@@ -838,7 +1275,7 @@ class BaseModel(PydanticBaseModel):
     {'properties': {'objectName': {'title': 'Objectname', 'type': 'string'}}, 'required': ['objectName'], 'title': 'DerivedModel', 'type': 'object'}
     """  # noqa: E501
 
-    model_config = ConfigDict(populate_by_name=True, alias_generator=to_camel, validate_assignment=True)
+    model_config = ConfigDict(populate_by_name=True, alias_generator=_to_camel_cached, validate_assignment=True)
 
     def __init__(self, /, **data: Any) -> None:
         super(BaseModel, self).__init__(**data)
@@ -851,34 +1288,8 @@ class BaseModel(PydanticBaseModel):
         super(BaseModel, self).__setattr__(name, value)
         self.on_update(name, value)
 
-    def model_dump_json(
-        self,
-        *,
-        indent: int | None = None,
-        include: IncEx | None = None,
-        exclude: IncEx | None = None,
-        context: JsonSchemaValue | None = None,
-        by_alias: bool = True,
-        exclude_unset: bool = False,
-        exclude_defaults: bool = False,
-        exclude_none: bool = False,
-        round_trip: bool = False,
-        warnings: bool | Literal["none"] | Literal["warn"] | Literal["error"] = True,
-        serialize_as_any: bool = False,
-    ) -> str:
-        return super().model_dump_json(
-            indent=indent,
-            include=include,
-            exclude=exclude,
-            context=context,
-            by_alias=by_alias,
-            exclude_unset=exclude_unset,
-            exclude_defaults=exclude_defaults,
-            exclude_none=exclude_none,
-            round_trip=round_trip,
-            warnings=warnings,
-            serialize_as_any=serialize_as_any,
-        )
+    def model_dump_json(self, *, by_alias: bool | None = True, **kwargs: Any) -> str:
+        return super().model_dump_json(by_alias=by_alias, **kwargs)
 
     def on_create(self) -> None:
         pass
@@ -890,32 +1301,55 @@ class BaseModel(PydanticBaseModel):
         pass
 
 
+class TrustedBaseModel(BaseModel):
+    """
+    BaseModel for data that has already been validated, e.g. models kept in an in-process cache.
+    Assignments are not re-validated and from_trusted_dict skips validation entirely.
+    Nothing is converted either: every value must already be of its declared field type (Id, Timestamp,
+    nested models, ...). Raw values such as database rows or decoded JSON must go through model_validate.
+
+    >>> class DerivedModel(TrustedBaseModel):
+    ...   object_name: str
+    >>> x = DerivedModel.from_trusted_dict({"objectName": "test"})
+    >>> x
+    DerivedModel(object_name='test')
+    >>> x.object_name = "test2"
+    >>> x.model_dump_json()
+    '{"objectName":"test2"}'
+    """
+
+    model_config = ConfigDict(validate_assignment=False, revalidate_instances="never")
+
+    @classmethod
+    def from_trusted_dict(cls: Type[TrustedModelT], data: Dict[str, Any]) -> TrustedModelT:
+        instance = cast(TrustedModelT, cls.model_construct(**data))
+        instance.on_create()
+        return instance
+
+
+_JSON_SCHEMA_PRIMITIVE_TYPES: Mapping[str, Type[int | str | float | bool]] = MappingProxyType(
+    {"integer": int, "string": str, "number": float, "boolean": bool}
+)
+
+
 def _json_schema_type_to_python_type(json_schema_type: Dict[str, Any], defs: Dict[str, Type[BaseModel]]) -> Type[Any]:
-    primitive_map: Dict[str, Type[int | str | float | bool]] = {
-        "integer": int,
-        "string": str,
-        "number": float,
-        "boolean": bool,
-    }
-    if "type" in json_schema_type:
-        t = json_schema_type["type"]
-        if t in primitive_map:
-            return primitive_map[t]
-        if t == "array":
+    t = json_schema_type.get("type")
+    if (primitive := _JSON_SCHEMA_PRIMITIVE_TYPES.get(t)) is not None:  # type: ignore[arg-type]
+        return primitive
+    match t:
+        case "array":
             if "items" in json_schema_type:
                 items = json_schema_type["items"]
                 if "type" in items:
-                    tt = primitive_map[items["type"]]
-                    if isinstance(tt, type):
-                        return Sequence[tt]  # type: ignore[valid-type]
-                    raise ValueError(f"Cannot convert {json_schema_type} to Python type")
+                    tt = _JSON_SCHEMA_PRIMITIVE_TYPES[items["type"]]
+                    return Sequence[tt]  # type: ignore[valid-type]
                 if "$ref" in items:
                     reftype = items["$ref"]
                     if reftype in defs:
                         return Sequence[defs[reftype]]  # type: ignore[valid-type]
                     raise ValueError(f"Cannot convert {json_schema_type} to Python type")
             return list
-        if t == "object":
+        case "object":
             if "$ref" in json_schema_type:
                 return defs[json_schema_type["$ref"]]
             return dict
@@ -939,16 +1373,31 @@ def _property_to_model(
     class_name = (
         json_schema["title"] if "title" in json_schema and isinstance(json_schema["title"], str) else "GeneratedModel"
     )
-    dynamic_model = create_model(
-        class_name,
-        __base__=base_model,
-        **{to_snake(k): (_json_schema_type_to_python_type(v, defs), ...) for k, v in json_schema["properties"].items()},
-    )  # type: ignore[call-overload]
+    fields: Dict[str, Any] = {}
+    for k, v in json_schema["properties"].items():
+        fields[sys.intern(_to_snake_cached(k))] = (_json_schema_type_to_python_type(v, defs), ...)
+    dynamic_model = create_model(class_name, __base__=base_model, **fields)
     if not isinstance(dynamic_model, type):
         raise ValueError("create_model failed")
     return dynamic_model
 
 
+def _collect_refs(node: Any) -> Iterable[str]:
+    """
+    >>> sorted(_collect_refs({"a": {"$ref": "#/$defs/A"}, "b": {"items": [{"$ref": "#/$defs/B"}]}}))
+    ['#/$defs/A', '#/$defs/B']
+    """
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "$ref" and isinstance(value, str):
+                yield value
+            else:
+                yield from _collect_refs(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _collect_refs(value)
+
+
 def json_schema_to_model(json_schema: Dict[str, Any], base_model: Type[BaseModel] = BaseModel) -> Type[BaseModel]:
     """
     >>> x = {
@@ -974,25 +1423,35 @@ def json_schema_to_model(json_schema: Dict[str, Any], base_model: Type[BaseModel
     >>> generated_model = json_schema_to_model(x)
     >>> generated_model(nested={"obj": {"name": "foo", "age": 42}, "flag": True})
     MyModel(nested=MyNestedModel(obj=MyNestedNestedModel(name='foo', age=42)))
+    >>> json_schema_to_model(x) is generated_model
+    True
     """
+    try:
+        serialized_json_schema = json.dumps(json_schema)
+    except TypeError:
+        return _build_model_from_json_schema(json_schema, base_model)
+    return _json_schema_to_model_cached(serialized_json_schema, base_model)
+
+
+@lru_cache(maxsize=256)
+def _json_schema_to_model_cached(serialized_json_schema: str, base_model: Type[BaseModel]) -> Type[BaseModel]:
+    return _build_model_from_json_schema(json.loads(serialized_json_schema), base_model)
+
+
+def _build_model_from_json_schema(json_schema: Dict[str, Any], base_model: Type[BaseModel]) -> Type[BaseModel]:
     if "properties" not in json_schema:
         raise ValueError("properties key is not found in json_schema")
-    unresolved_refs = json_schema.get("$defs", {})
+    definitions = {f"#/$defs/{k}": v for k, v in json_schema.get("$defs", {}).items()}
+    dependencies = {ref: set(_collect_refs(definition)) for ref, definition in definitions.items()}
+    if any(not deps.issubset(definitions) for deps in dependencies.values()):
+        raise ValueError("Cannot resolve all references")
+    try:
+        order = tuple(TopologicalSorter(dependencies).static_order())
+    except CycleError as e:
+        raise ValueError("Cannot resolve all references") from e
     resolved_refs: Dict[str, Type[BaseModel]] = {}
-    while unresolved_refs:
-        before_len = len(unresolved_refs)
-        key_seq = list(unresolved_refs.keys())
-        for k in key_seq:
-            try:
-                resolved_refs[f"#/$defs/{k}"] = _property_to_model(
-                    unresolved_refs[k], resolved_refs, base_model=base_model
-                )
-                unresolved_refs.pop(k)
-            except KeyError:
-                continue
-            ...
-        if before_len == len(unresolved_refs):
-            raise ValueError("Cannot resolve all references")
+    for ref in order:
+        resolved_refs[ref] = _property_to_model(definitions[ref], resolved_refs, base_model=base_model)
 
     return _property_to_model(json_schema, resolved_refs, base_model=base_model)
 
@@ -1012,7 +1471,7 @@ class BaseEntity(BaseModel, Generic[IdT]):
     {'properties': {'id': {'format': 'crockfordBase32', 'title': 'Id', 'type': 'string'}}, 'title': 'DerivedEntity', 'type': 'object'}
     """  # noqa: E501
 
-    id: IdT = Field(default_factory=lambda: cast(IdT, Id.generate()), validate_default=True, frozen=True)
+    id: IdT = Field(default_factory=Id.generate, validate_default=True, frozen=True)
 
 
 class BaseCreationTimeAwareModel(BaseModel):
@@ -1047,8 +1506,9 @@ class BaseUpdateTimeAwareModel(BaseCreationTimeAwareModel):
     def __setattr__(self, name: str, value: Any) -> None:
         if name == "updated_at":
             return super(BaseUpdateTimeAwareModel, self).__setattr__(name, value)
-        try:
-            super(BaseUpdateTimeAwareModel, self).__setattr__(name, value)
-        except Exception as e:
-            raise e
-        super(BaseUpdateTimeAwareModel, self).__setattr__("updated_at", Timestamp.now())
+        super(BaseUpdateTimeAwareModel, self).__setattr__(name, value)
+        # Timestamp.now() is already a valid updated_at, so skip validate_assignment for the bump.
+        updated_at = Timestamp.now()
+        self.__dict__["updated_at"] = updated_at
+        self.__pydantic_fields_set__.add("updated_at")
+        self.on_update("updated_at", updated_at)
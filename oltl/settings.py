@@ -1,5 +1,8 @@
-from typing import Optional, Type, TypeVar
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Type, TypeVar, Union
 
+import yaml
 from pydantic import Field, FilePath
 from pydantic_settings import BaseSettings as PydanticBaseSettings
 from pydantic_settings import (
@@ -9,10 +12,35 @@ from pydantic_settings import (
     YamlConfigSettingsSource,
 )
 
-from .utils import patch_config_value
+from .utils import ConfigKey, get_config_value, patch_config_value
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from importlib.abc import Traversable
 
 SettingsClassT = TypeVar("SettingsClassT", bound="BaseSettings")
 
+_CONFIG_KEY_BY_EXTENSION: Mapping[str, ConfigKey] = MappingProxyType(
+    {"json": "json_file", "yaml": "yaml_file", "yml": "yaml_file"}
+)
+
+
+class LibYamlConfigSettingsSource(YamlConfigSettingsSource):
+    """YamlConfigSettingsSource that parses with libyaml's CSafeLoader when PyYAML was built with it.
+
+    This overrides pydantic-settings' private ``_read_file`` hook; pyproject pins the supported
+    pydantic-settings range and tests/test_settings.py checks that the hook is still called.
+    """
+
+    def _read_file(self, file_path: Union[Path, "Traversable"]) -> Dict[str, Any]:
+        with file_path.open(encoding=self.yaml_file_encoding) as yaml_file:
+            data: Optional[Dict[str, Any]] = yaml.load(yaml_file, Loader=SafeLoader)
+            return data or {}
+
 
 class BaseSettings(PydanticBaseSettings):
     """Base settings for the application.
@@ -52,8 +80,8 @@ class BaseSettings(PydanticBaseSettings):
     ) -> tuple[PydanticBaseSettingsSource, ...]:
         return (
             init_settings,
-            JsonConfigSettingsSource(settings_cls),
-            YamlConfigSettingsSource(settings_cls),
+            JsonConfigSettingsSource(settings_cls, json_file=get_config_value(settings_cls, "json_file")),
+            LibYamlConfigSettingsSource(settings_cls, yaml_file=get_config_value(settings_cls, "yaml_file")),
             env_settings,
             dotenv_settings,
             file_secret_settings,
@@ -62,10 +90,8 @@ class BaseSettings(PydanticBaseSettings):
     @classmethod
     def load(cls: Type[SettingsClassT], setting_file_path: Optional[str] = None) -> SettingsClassT:
         if setting_file_path is not None:
-            if setting_file_path.endswith(".json"):
-                with patch_config_value(cls, "json_file", setting_file_path):
-                    return cls()
-            if setting_file_path.endswith(".yaml") or setting_file_path.endswith(".yml"):
-                with patch_config_value(cls, "yaml_file", setting_file_path):
+            key = _CONFIG_KEY_BY_EXTENSION.get(setting_file_path.rpartition(".")[2])
+            if key is not None:
+                with patch_config_value(cls, key, setting_file_path):
                     return cls()
         return cls()
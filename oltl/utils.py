@@ -2,7 +2,9 @@ import re
 import unicodedata
 from collections.abc import Generator
 from contextlib import contextmanager
-from typing import Any, Literal, Type
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, Literal, Mapping, Tuple, Type
 
 from pydantic_settings import BaseSettings
 
@@ -29,26 +31,44 @@ normalize_trans_map = str.maketrans(
     }
 )
 
-parentheses_left = re.compile(r"([^\s(])\(")
-parentheses_right = re.compile(r"\)([^\s)])")
+parentheses_spacing = re.compile(r"(?<=[^\s(])(?=\()|(?<=\))(?=[^\s()])")
 
 
 def normalize_jptext(
     x: str,
 ) -> str:
-    normalized_string = parentheses_right.sub(
-        r") \1", parentheses_left.sub(r"\1 (", unicodedata.normalize("NFKC", x).translate(normalize_trans_map))
-    )
-    return normalized_string
+    if x.isascii():
+        # ASCII is already NFKC-stable and "\t" is the only ASCII key in normalize_trans_map.
+        normalized_string = x.replace("\t", " ")
+    else:
+        normalized_string = unicodedata.normalize("NFKC", x).translate(normalize_trans_map)
+    if "(" not in normalized_string and ")" not in normalized_string:
+        return normalized_string
+    return parentheses_spacing.sub(" ", normalized_string)
+
+
+ConfigKey = Literal["json_file", "yaml_file"]
+
+_config_value_overrides: ContextVar[Mapping[Tuple[Type[BaseSettings], ConfigKey], Any]] = ContextVar(
+    "_config_value_overrides", default=MappingProxyType({})
+)
+
+
+def get_config_value(cls: Type[BaseSettings], key: ConfigKey) -> Any:
+    overrides = _config_value_overrides.get()
+    if (cls, key) in overrides:
+        return overrides[(cls, key)]
+    return cls.model_config.get(key)
 
 
 @contextmanager
 def patch_config_value(
     cls: Type[BaseSettings],
-    key: Literal["json_file", "yaml_file"],
+    key: ConfigKey,
     value: Any,
 ) -> Generator[None, None, None]:
-    old_value = cls.model_config[key]
-    cls.model_config[key] = value
-    yield
-    cls.model_config[key] = old_value
+    token = _config_value_overrides.set(MappingProxyType({**_config_value_overrides.get(), (cls, key): value}))
+    try:
+        yield
+    finally:
+        _config_value_overrides.reset(token)
@@ -1,8 +1,16 @@
+from typing import Any, Dict
+
 from pydantic import ValidationError
 
 from oltl import core
 
 
+def _validation_error(error_type: str, ctx: Dict[str, Any], input_value: Any) -> ValidationError:
+    return ValidationError.from_exception_data(
+        title="TestModel", line_errors=[{"loc": ("value",), "type": error_type, "ctx": ctx, "input": input_value}]
+    )
+
+
 class LimitedMinLength(core.LimitedMinLengthStringMixIn):
     @classmethod
     def get_min_length(cls) -> int:
@@ -87,34 +95,14 @@ string_test_cases = [
         (
             (
                 "a",
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "string_too_short",
-                            "ctx": {"min_length": 3},
-                            "input": "a",
-                        }
-                    ],
-                ),
+                _validation_error("string_too_short", {"min_length": 3}, "a"),
             ),
             ("abc", "abc"),
             ("abcde", "abcde"),
             ("ﾊﾞﾋﾞ", "ﾊﾞﾋﾞ"),
             (
                 "バビ",
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "string_too_short",
-                            "ctx": {"min_length": 3},
-                            "input": "バビ",
-                        }
-                    ],
-                ),
+                _validation_error("string_too_short", {"min_length": 3}, "バビ"),
             ),
         ),
     ),
@@ -125,31 +113,11 @@ string_test_cases = [
             ("abc", "abc"),
             (
                 "abcde",
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "string_too_long",
-                            "ctx": {"max_length": 4},
-                            "input": "abcde",
-                        }
-                    ],
-                ),
+                _validation_error("string_too_long", {"max_length": 4}, "abcde"),
             ),
             (
                 "ﾊﾞﾋﾞﾌﾞ",
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "string_too_long",
-                            "ctx": {"max_length": 4},
-                            "input": "ﾊﾞﾋﾞﾌﾞ",
-                        }
-                    ],
-                ),
+                _validation_error("string_too_long", {"max_length": 4}, "ﾊﾞﾋﾞﾌﾞ"),
             ),
         ),
     ),
@@ -158,17 +126,7 @@ string_test_cases = [
         (
             (
                 "",
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "string_too_short",
-                            "ctx": {"min_length": 1},
-                            "input": "",
-                        }
-                    ],
-                ),
+                _validation_error("string_too_short", {"min_length": 1}, ""),
             ),
             ("a", "a"),
         ),
@@ -178,33 +136,13 @@ string_test_cases = [
         (
             (
                 "a",
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "string_too_short",
-                            "ctx": {"min_length": 3},
-                            "input": "a",
-                        }
-                    ],
-                ),
+                _validation_error("string_too_short", {"min_length": 3}, "a"),
             ),
             ("abc", "abc"),
             ("abcd", "abcd"),
             (
                 "abcde",
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "string_too_long",
-                            "ctx": {"max_length": 4},
-                            "input": "abcde",
-                        }
-                    ],
-                ),
+                _validation_error("string_too_long", {"max_length": 4}, "abcde"),
             ),
         ),
     ),
@@ -227,17 +165,7 @@ string_test_cases = [
         (
             (
                 "a",
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "string_too_short",
-                            "ctx": {"min_length": 3},
-                            "input": "a",
-                        }
-                    ],
-                ),
+                _validation_error("string_too_short", {"min_length": 3}, "a"),
             ),
             (
                 "　　not　normalized　　",
@@ -245,31 +173,11 @@ string_test_cases = [
             ),
             (
                 "バビ",
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "string_too_short",
-                            "ctx": {"min_length": 3},
-                            "input": "バビ",
-                        }
-                    ],
-                ),
+                _validation_error("string_too_short", {"min_length": 3}, "バビ"),
             ),
             (
                 "ﾊﾞﾋﾞ",
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "string_too_short",
-                            "ctx": {"min_length": 3},
-                            "input": "バビ",
-                        }
-                    ],
-                ),
+                _validation_error("string_too_short", {"min_length": 3}, "バビ"),
             ),
         ),
     ),
@@ -284,17 +192,7 @@ string_test_cases = [
             ("ﾊﾞﾋﾞﾌﾞ", "バビブ"),
             (
                 "　　　　　",
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "string_too_long",
-                            "ctx": {"max_length": 4},
-                            "input": "     ",
-                        }
-                    ],
-                ),
+                _validation_error("string_too_long", {"max_length": 4}, "     "),
             ),
         ),
     ),
@@ -317,17 +215,7 @@ string_test_cases = [
         (
             (
                 "    ",
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "string_too_short",
-                            "ctx": {"min_length": 1},
-                            "input": "    ",
-                        }
-                    ],
-                ),
+                _validation_error("string_too_short", {"min_length": 1}, "    "),
             ),
             (
                 "　　not　trimmed　　",
@@ -344,17 +232,7 @@ string_test_cases = [
         (
             (
                 "  a  ",
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "string_too_short",
-                            "ctx": {"min_length": 3},
-                            "input": "  a  ",
-                        }
-                    ],
-                ),
+                _validation_error("string_too_short", {"min_length": 3}, "  a  "),
             ),
             (
                 "　　not　trimmed　　",
@@ -476,34 +354,14 @@ integer_test_cases = [
         (
             (
                 2,
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "greater_than_equal",
-                            "ctx": {"ge": 3},
-                            "input": 2,
-                        }
-                    ],
-                ),
+                _validation_error("greater_than_equal", {"ge": 3}, 2),
             ),
             (3, 3),
             (4, 4),
             (5, 5),
             (
                 6,
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "less_than_equal",
-                            "ctx": {"le": 5},
-                            "input": 6,
-                        }
-                    ],
-                ),
+                _validation_error("less_than_equal", {"le": 5}, 6),
             ),
         ),
     ),
@@ -526,34 +384,14 @@ float_test_cases = [
         (
             (
                 2.9,
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "greater_than_equal",
-                            "ctx": {"ge": 3.0},
-                            "input": 2.9,
-                        }
-                    ],
-                ),
+                _validation_error("greater_than_equal", {"ge": 3.0}, 2.9),
             ),
             (3.0, 3.0),
             (4.0, 4.0),
             (5.0, 5.0),
             (
                 5.1,
-                ValidationError.from_exception_data(
-                    title="TestModel",
-                    line_errors=[
-                        {
-                            "loc": ("value",),
-                            "type": "less_than_equal",
-                            "ctx": {"le": 5.0},
-                            "input": 5.1,
-                        }
-                    ],
-                ),
+                _validation_error("less_than_equal", {"le": 5.0}, 5.1),
             ),
         ),
     ),
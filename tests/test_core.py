@@ -1,11 +1,18 @@
+import base64
+import copy
+import pickle
 import re
+import time
 from collections.abc import Sequence
 from datetime import datetime, timezone
-from typing import Any, Tuple, TypeAlias, Union
+from types import MappingProxyType
+from typing import Annotated, Any, Tuple, TypeAlias, Union
 
 import pytest
+import ulid
 from freezegun import freeze_time
-from pydantic import ValidationError
+from pydantic import Field, GetCoreSchemaHandler, TypeAdapter, ValidationError
+from pydantic_core import PydanticSerializationError, core_schema
 from pytest_mock import MockerFixture
 from ulid import ULID
 
@@ -393,3 +400,686 @@ def test_update_time_aware_model_serialize_deserialize() -> None:
     assert actual == serialize_expected
     deserialize_expected = model
     assert MyModel.model_validate_json(actual) == deserialize_expected
+
+
+def test_base_string_from_str_reuses_type_adapter(mocker: MockerFixture) -> None:
+    class MyString(core.NonEmptyStringMixIn): ...
+
+    spy = mocker.spy(core, "TypeAdapter")
+    assert MyString.from_str("foo") == MyString("foo")
+    assert MyString.from_str("bar") == MyString("bar")
+    assert spy.call_count == 1
+
+
+def test_timestamp_accepts_subclassed_inputs() -> None:
+    class MyDatetime(datetime): ...
+
+    expected = core.Timestamp(datetime(2024, 3, 14, 18, 52, 43, 123456, tzinfo=timezone.utc))
+    assert core.Timestamp(MyDatetime(2024, 3, 14, 18, 52, 43, 123456, tzinfo=timezone.utc)) == expected
+    assert core.Timestamp(core.BaseString("2024-03-14T18:52:43.123456+00:00")) == expected
+    assert core.Timestamp(core.BaseFloat(1710442363.5)) == core.Timestamp(1710442363500000)
+    assert core.Timestamp(core.BaseInteger(1710442363123456)) == expected
+
+
+def test_id_accepts_subclassed_inputs() -> None:
+    class MyId(core.Id): ...
+
+    expected = core.Id("01HRQ0KA867PDGYJXAVGKG3R1V")
+    assert core.Id(MyId("01HRQ0KA867PDGYJXAVGKG3R1V")) == expected
+    assert core.Id(core.BaseBytes(b"\x01\x8e.\t\xa9\x06=\x9b\x0fK\xaa\xdc'\x01\xe0;")) == expected
+    assert core.Id(core.BaseString("01HRQ0KA867PDGYJXAVGKG3R1V")) == expected
+
+
+def test_timestamp_parses_iso_format_without_dateutil(mocker: MockerFixture) -> None:
+    spy = mocker.spy(core, "parse_datetime")
+    assert core.Timestamp("2023-01-22T14:29:24.422Z") == core.Timestamp(1674397764422000)
+    assert core.Timestamp("2023-01-22T14:29:24.422+00:00") == core.Timestamp(1674397764422000)
+    assert spy.call_count == 0
+    assert core.Timestamp("Sun, 22 Jan 2023 14:29:24 +0000") == core.Timestamp(1674397764000000)
+    assert spy.call_count == 1
+
+
+def test_base_string_from_str_does_not_share_type_adapter_with_parent() -> None:
+    class MyString(core.BaseString): ...
+
+    class MyNonEmptyString(core.NonEmptyStringMixIn, MyString): ...
+
+    assert type(MyString.from_str("foo")) is MyString
+    assert type(MyNonEmptyString.from_str("foo")) is MyNonEmptyString
+    with pytest.raises(ValidationError):
+        MyNonEmptyString.from_str("")
+
+
+def test_base_string_extra_constraint_dict_is_computed_once_per_class(mocker: MockerFixture) -> None:
+    class MyString(core.LimitedMaxLengthStringMixIn):
+        @classmethod
+        def get_max_length(cls) -> int:
+            return 4
+
+    spy = mocker.spy(MyString, "get_max_length")
+
+    class FirstModel(core.BaseModel):
+        value: MyString
+
+    class SecondModel(core.BaseModel):
+        value: MyString
+
+    assert FirstModel(value="abcd").value == "abcd"
+    with pytest.raises(ValidationError):
+        SecondModel(value="abcde")
+    assert MyString.check("abc") == "abc"
+    with pytest.raises(ValueError):
+        MyString.check("abcde")
+    assert spy.call_count == 1
+    with pytest.raises(TypeError):
+        MyString._get_extra_constraint_dict()["max_length"] = 5  # type: ignore[index]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "01HRQ0KA867PDGYJXAVGKG3R1V",
+        "01hrq0ka867pdgyjxavgkg3r1v",
+        "0IHRQ0KA867PDGYJXAVGKG3R1V",
+        "01HRQOKA867PDGYJXAVGKG3RlV",
+    ],
+)
+def test_id_decodes_crockford_base32(value: str) -> None:
+    assert core.Id(value).bytes == ULID(ulid.base32.decode_ulid(value)).bytes
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "81HRQ0KA867PDGYJXAVGKG3R1V",
+        "01HRQ0KA867PDGYJXAVGKG3R1U",
+        "01HRQ0KA867PDGYJXAVGKG3R1_",
+        "01HRQ0KA867PDGYJXAVGKG3R1 ",
+        "01HRQ0KA867PDGYJXAVGKG3R1Ｖ",
+    ],
+)
+def test_id_rejects_invalid_ulid_string(value: str) -> None:
+    with pytest.raises(ValueError, match=f"Invalid ULID string: {value}"):
+        core.Id(value)
+
+
+@pytest.mark.parametrize("value", [bytearray(16), 1, ["01HRQ0KA867PDGYJXAVGKG3R1V"]])
+def test_id_rejects_unhashable_and_non_string_input(value: Any) -> None:
+    with pytest.raises(ValueError, match="Invalid ULID string"):
+        core.Id(value)
+
+
+def test_id_encodes_string_once(mocker: MockerFixture) -> None:
+    spy = mocker.spy(ulid.base32, "encode_ulid")
+    sut = core.Id(b"\x01\x8e.\t\xa9\x06=\x9b\x0fK\xaa\xdc'\x01\xe0;")
+    assert sut.serialize() == "01HRQ0KA867PDGYJXAVGKG3R1V"
+    assert str(sut) == "01HRQ0KA867PDGYJXAVGKG3R1V"
+    assert repr(sut) == "Id('01HRQ0KA867PDGYJXAVGKG3R1V')"
+    assert spy.call_count == 1
+
+
+def test_timestamp_now_is_epoch_microseconds() -> None:
+    before = time.time_ns() // 1000
+    actual = core.Timestamp.now()
+    actual_ns = core.Timestamp.now_ns()
+    after = time.time_ns() // 1000
+    assert type(actual) is core.Timestamp
+    assert before <= actual <= after
+    assert before * 1000 <= actual_ns <= after * 1000 + 999
+
+
+def test_base_string_skips_proc_str_unless_overridden(mocker: MockerFixture) -> None:
+    class Plain(core.LimitedMaxLengthStringMixIn):
+        @classmethod
+        def get_max_length(cls) -> int:
+            return 4
+
+    class Processed(core.SnakeCaseStringMixIn, Plain): ...
+
+    assert Processed.from_str("aBc") == "a_bc"
+    spy = mocker.spy(Plain, "_proc_str")
+    assert Plain.from_str("aBc") == "aBc"
+    assert spy.call_count == 0
+
+
+def test_base_string_core_schema_is_not_affected_by_field_constraints() -> None:
+    class MyString(core.BaseString): ...
+
+    class ConstrainedModel(core.BaseModel):
+        value: Annotated[MyString, Field(max_length=2)]
+
+    class PlainModel(core.BaseModel):
+        value: MyString
+
+    with pytest.raises(ValidationError):
+        ConstrainedModel(value="abc")
+    assert PlainModel(value="abc").value == MyString("abc")
+
+
+def test_id_from_ulid_does_not_alias_mutable_buffer() -> None:
+    raw = bytearray(b"\x01\x8e.\t\xa9\x06=\x9b\x0fK\xaa\xdc'\x01\xe0;")
+    source = ULID(raw)
+    shared = core.Id(ULID(bytes(raw)))
+    actual = core.Id(source)
+    raw[0] = 0
+    assert actual == core.Id("01HRQ0KA867PDGYJXAVGKG3R1V")
+    assert shared == actual
+    assert hash(shared) == hash(actual)
+
+
+def test_timestamp_from_datetime_keeps_microsecond_precision() -> None:
+    dt = datetime(2262, 4, 11, 23, 47, 16, 854775, tzinfo=timezone.utc)
+    assert core.Timestamp(dt) == core.Timestamp(9223372036854775)
+    assert core.Timestamp(dt).datetime == dt
+    assert core.Timestamp(datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc)) == core.Timestamp(-1)
+
+
+def test_timestamp_from_float_truncates_to_microseconds() -> None:
+    assert core.Timestamp(1674397764.479) == core.Timestamp(1674397764479000)
+    assert core.Timestamp(0.0000019) == core.Timestamp(1)
+
+
+def test_base_string_from_str_returns_instance_of_same_class_as_is() -> None:
+    class MyString(core.BaseString): ...
+
+    class MyDerivedString(MyString): ...
+
+    value = MyString("foo")
+    assert MyString.from_str(value) is value
+    assert MyString._type_adapter is None
+    assert type(MyDerivedString.from_str(value)) is MyDerivedString
+
+
+def test_numeric_extra_constraint_dict_is_computed_once_per_class(mocker: MockerFixture) -> None:
+    class MyInteger(core.LowerBoundIntegerMixIn):
+        @classmethod
+        def get_min_value(cls) -> int:
+            return 3
+
+    class MyFloat(core.UpperBoundFloatMixIn):
+        @classmethod
+        def get_max_value(cls) -> float:
+            return 3.0
+
+    integer_spy = mocker.spy(MyInteger, "get_min_value")
+    float_spy = mocker.spy(MyFloat, "get_max_value")
+
+    class FirstModel(core.BaseModel):
+        integer: MyInteger
+        number: MyFloat
+
+    class SecondModel(core.BaseModel):
+        integer: MyInteger
+        number: MyFloat
+
+    assert FirstModel(integer=3, number=3.0) == FirstModel(integer=MyInteger(3), number=MyFloat(3.0))
+    with pytest.raises(ValidationError):
+        SecondModel(integer=2, number=3.1)
+    assert integer_spy.call_count == 1
+    assert float_spy.call_count == 1
+
+
+def test_base_string_serializes_natively_unless_serialize_is_overridden(mocker: MockerFixture) -> None:
+    class MyString(core.BaseString): ...
+
+    class MyUpperString(core.BaseString):
+        def serialize(self) -> core.JsonAcceptable:
+            return self.upper()
+
+    class MyModel(core.BaseModel):
+        value: MyString
+        upper_value: MyUpperString
+
+    spy = mocker.spy(MyString, "serialize")
+    model = MyModel(value="foo", upper_value="bar")
+    assert model.model_dump_json() == '{"value":"foo","upperValue":"BAR"}'
+    assert model.model_dump() == {"value": MyString("foo"), "upper_value": MyUpperString("bar")}
+    assert spy.call_count == 0
+
+
+def test_id_validate_interns_instances_per_class() -> None:
+    class MyId(core.Id): ...
+
+    first = core.Id.validate("01HRQ0KA867PDGYJXAVGKG3R1V")
+    assert core.Id.validate("01HRQ0KA867PDGYJXAVGKG3R1V") is first
+    derived = MyId.validate("01HRQ0KA867PDGYJXAVGKG3R1V")
+    assert type(derived) is MyId
+    assert derived is not first
+    assert derived == first
+    assert core.Id.validate(ULID(first.bytes)) is not first
+
+
+def test_base_string_from_strs_validates_each_value() -> None:
+    class MyString(core.SnakeCaseStringMixIn, core.NonEmptyStringMixIn): ...
+
+    assert MyString.from_strs(iter(["fooBar", "baz"])) == [MyString("foo_bar"), MyString("baz")]
+    assert all(type(v) is MyString for v in MyString.from_strs(["a"]))
+    with pytest.raises(ValidationError):
+        MyString.from_strs(["foo", ""])
+
+
+def test_unchecked_skips_validation(mocker: MockerFixture) -> None:
+    class MyString(core.SnakeCaseStringMixIn, core.NonEmptyStringMixIn): ...
+
+    spy = mocker.spy(MyString, "_proc_str")
+    value = MyString.unchecked("fooBar")
+    assert type(value) is MyString
+    assert value == "fooBar"
+    assert spy.call_count == 0
+    id_ = core.Id.unchecked(core.Id("01HRQ0KA867PDGYJXAVGKG3R1V").bytes)
+    assert type(id_) is core.Id
+    assert id_ == core.Id("01HRQ0KA867PDGYJXAVGKG3R1V")
+
+
+def test_id_keeps_bytes_and_string_across_copy_and_pickle() -> None:
+    value = core.Id("01HRQ0KA867PDGYJXAVGKG3R1V")
+    assert not hasattr(value, "__dict__")
+    assert value.bytes == b"\x01\x8e.\t\xa9\x06=\x9b\x0fK\xaa\xdc'\x01\xe0;"
+    for restored in (copy.copy(value), copy.deepcopy(value), pickle.loads(pickle.dumps(value))):
+        assert type(restored) is core.Id
+        assert restored == value
+        assert restored.bytes == value.bytes
+        assert str(restored) == "01HRQ0KA867PDGYJXAVGKG3R1V"
+
+
+def test_id_core_schema_is_built_once_per_class(mocker: MockerFixture) -> None:
+    class MyId(core.Id): ...
+
+    spy = mocker.spy(core_schema, "no_info_plain_validator_function")
+
+    class FirstModel(core.BaseModel):
+        value: MyId
+
+    class SecondModel(core.BaseModel):
+        value: MyId
+        other: Annotated[MyId, Field(default_factory=MyId.generate)]
+
+    assert spy.call_count == 1
+    assert type(SecondModel(value="01HRQ0KA867PDGYJXAVGKG3R1V").value) is MyId
+    assert FirstModel(value="01HRQ0KA867PDGYJXAVGKG3R1V").model_dump_json() == '{"value":"01HRQ0KA867PDGYJXAVGKG3R1V"}'
+
+
+def test_base_string_check_matches_pydantic_validation() -> None:
+    class MyString(
+        core.TrimmedStringMixIn,
+        core.SnakeCaseStringMixIn,
+        core.RegexMatchedStringMixIn,
+        core.LimitedMaxLengthStringMixIn,
+        core.NonEmptyStringMixIn,
+    ):
+        @classmethod
+        def get_pattern(cls) -> str:
+            return "^[a-z_]+$"
+
+        @classmethod
+        def get_max_length(cls) -> int:
+            return 7
+
+    for value in ("fooBar", "  foo  ", "a"):
+        checked = MyString.check(value)
+        assert type(checked) is MyString
+        assert checked == MyString.from_str(value)
+    for value in ("", "   ", "fooBarBaz", "foo1"):
+        with pytest.raises(ValueError):
+            MyString.check(value)
+        with pytest.raises(ValidationError):
+            MyString.from_str(value)
+    with pytest.raises(ValueError, match="Input should be a valid string"):
+        MyString.check(123)  # type: ignore[arg-type]
+
+    class MyTrimmed(core.TrimmedStringMixIn): ...
+
+    for value in ("\x1c a \x1c", "　a ", "\x85\xa0a"):
+        assert MyTrimmed.check(value) == MyTrimmed.from_str(value)
+
+
+@pytest.mark.parametrize("value", [b"", b"a", b"test", bytes(range(256)) * 4])
+def test_base_bytes_round_trips_base64(value: bytes) -> None:
+    encoded = core.BaseBytes(value).serialize()
+    assert encoded == base64.standard_b64encode(value).decode()
+    assert core.BaseBytes(encoded) == value
+
+
+def test_regex_substituted_string_compiles_patterns_once_per_class(mocker: MockerFixture) -> None:
+    class MyString(core.RegexSubstitutedStringMixIn):
+        @classmethod
+        def get_pattern_to_repl_map(cls) -> MappingProxyType[str, str]:
+            return MappingProxyType({r"\s+": " ", r"-+": "-"})
+
+    class MyDerivedString(MyString):
+        @classmethod
+        def get_pattern_to_repl_map(cls) -> MappingProxyType[str, str]:
+            return MappingProxyType({"a": "b"})
+
+    spy = mocker.spy(MyString, "get_pattern_to_repl_map")
+    assert MyString.from_str("a  b--c") == "a b-c"
+    assert MyString.from_str("d\n\te") == "d e"
+    assert spy.call_count == 1
+    assert MyDerivedString.from_str("aa  --") == "bb  --"
+
+
+def test_base_string_from_str_skips_pydantic_without_constraints(mocker: MockerFixture) -> None:
+    class MyString(core.SnakeCaseStringMixIn): ...
+
+    class MyNonEmptyString(core.SnakeCaseStringMixIn, core.NonEmptyStringMixIn): ...
+
+    spy = mocker.spy(TypeAdapter, "validate_python")
+    assert MyString.from_str("fooBar") == "foo_bar"
+    assert type(MyString.from_str("")) is MyString
+    assert spy.call_count == 0
+    with pytest.raises(ValidationError):
+        MyNonEmptyString.from_str("")
+    assert spy.call_count == 1
+
+
+def test_base_string_from_str_honors_overridden_core_schema() -> None:
+    def check_upper(value: str) -> str:
+        if not value.isupper():
+            raise ValueError("String should be upper case")
+        return value
+
+    class Upper(core.BaseString):
+        @classmethod
+        def __get_pydantic_core_schema__(
+            cls, source_type: Any, handler: GetCoreSchemaHandler
+        ) -> core_schema.CoreSchema:
+            return core_schema.no_info_after_validator_function(
+                check_upper, super().__get_pydantic_core_schema__(source_type, handler)
+            )
+
+    class DerivedUpper(Upper): ...
+
+    assert Upper.from_str("ABC") == "ABC"
+    for sut in (Upper, DerivedUpper):
+        with pytest.raises(ValidationError):
+            sut.from_str("abc")
+        with pytest.raises(ValidationError):
+            TypeAdapter(sut).validate_python("abc")
+
+
+def test_base_string_applies_proc_str_steps_in_mro_order() -> None:
+    class SnakeThenCamel(core.SnakeCaseStringMixIn, core.CamelCaseStringMixIn): ...
+
+    class CamelThenSnake(core.CamelCaseStringMixIn, core.SnakeCaseStringMixIn): ...
+
+    class Custom(CamelThenSnake):
+        @classmethod
+        def _proc_str(cls, s: str) -> str:
+            return super()._proc_str(s.replace("-", "_"))
+
+    assert SnakeThenCamel.from_str("foo_bar") == "fooBar"
+    assert CamelThenSnake.from_str("fooBar") == "foo_bar"
+    assert Custom.from_str("foo-bar") == "foo_bar"
+
+
+def test_base_string_proc_str_step_is_additive() -> None:
+    class SuffixedSnake(core.SnakeCaseStringMixIn):
+        @classmethod
+        def _proc_str_step(cls, s: str) -> str:
+            return s + "Suffix"
+
+    class ReplacedSnake(core.SnakeCaseStringMixIn):
+        @classmethod
+        def _proc_str(cls, s: str) -> str:
+            return s + "Suffix"
+
+    assert SuffixedSnake.from_str("fooBar") == "foo_bar_suffix"
+    assert ReplacedSnake.from_str("fooBar") == "fooBarSuffix"
+
+
+def test_trusted_base_model_skips_validation(mocker: MockerFixture) -> None:
+    class MyString(core.NonEmptyStringMixIn): ...
+
+    class MyModel(core.TrustedBaseModel):
+        id: core.Id
+        object_name: MyString
+
+        def on_create(self) -> None:
+            self.object_name = MyString(self.object_name.upper())
+
+    spy = mocker.spy(core.Id, "validate")
+    id_ = core.Id.generate()
+    model = MyModel.from_trusted_dict({"id": id_, "objectName": MyString("foo")})
+    assert model.id is id_
+    assert model.object_name == "FOO"
+    assert spy.call_count == 0
+    model.object_name = MyString("")
+    assert model.object_name == ""
+    assert spy.call_count == 0
+
+
+def test_trusted_base_model_requires_values_of_the_declared_types() -> None:
+    class MyModel(core.TrustedBaseModel):
+        id: core.Id
+        created_at: core.Timestamp
+
+    id_ = core.Id("01HRQ0KA867PDGYJXAVGKG3R1V")
+    typed = MyModel.from_trusted_dict({"id": id_, "createdAt": core.Timestamp(1674397764479000)})
+    assert typed.model_dump_json() == '{"id":"01HRQ0KA867PDGYJXAVGKG3R1V","createdAt":1674397764479000}'
+    raw = MyModel.from_trusted_dict({"id": "01HRQ0KA867PDGYJXAVGKG3R1V", "createdAt": 1674397764479000})
+    assert not isinstance(raw.id, core.Id)
+    with pytest.raises(PydanticSerializationError):
+        raw.model_dump_json()
+    assert MyModel.model_validate(raw.model_dump()) == typed
+
+
+def test_timestamp_serializes_natively_unless_serialize_is_overridden(mocker: MockerFixture) -> None:
+    class MillisecondTimestamp(core.Timestamp):
+        def serialize(self) -> int:
+            return self.milliseconds
+
+    class MyModel(core.BaseModel):
+        created_at: core.Timestamp
+        updated_at: MillisecondTimestamp
+
+    spy = mocker.spy(core.Timestamp, "serialize")
+    model = MyModel(created_at=1674397764479000, updated_at=MillisecondTimestamp(1674397764479000))
+    assert model.model_dump_json() == '{"createdAt":1674397764479000,"updatedAt":1674397764479}'
+    assert type(model.model_dump()["created_at"]) is core.Timestamp
+    assert spy.call_count == 0
+
+
+def test_base_bytes_returns_instance_of_same_class_as_is() -> None:
+    class MyBytes(core.BaseBytes): ...
+
+    value = MyBytes(b"test" * 1024)
+    assert MyBytes(value) is value
+    assert core.BaseBytes.validate(value) is value
+    converted = core.BaseBytes(value)
+    assert type(converted) is core.BaseBytes
+    assert converted == value
+
+
+def test_case_conversion_is_cached_for_short_strings(mocker: MockerFixture) -> None:
+    class MySnakeString(core.SnakeCaseStringMixIn): ...
+
+    class MyCamelString(core.CamelCaseStringMixIn): ...
+
+    spy = mocker.spy(core, "to_snake")
+    hits = core._to_snake_cached.cache_info().hits
+    assert MySnakeString.from_str("cachedFooBar") == "cached_foo_bar"
+    assert MySnakeString.from_str("cachedFooBar") == "cached_foo_bar"
+    assert core._to_snake_cached.cache_info().hits == hits + 1
+    assert MySnakeString.from_str("fooBar" * 30) == "foo_bar" * 30
+    assert spy.call_count == 1
+    assert MyCamelString.from_str("cached_foo_bar") == MyCamelString.from_str("cached_foo_bar") == "cachedFooBar"
+
+
+def test_normalization_is_cached_for_short_strings(mocker: MockerFixture) -> None:
+    class MyNormalizedString(core.NormalizedStringMixIn): ...
+
+    spy = mocker.spy(core, "normalize_jptext")
+    hits = core._normalize_jptext_cached.cache_info().hits
+    assert MyNormalizedString.from_str("ｷｬｯｼｭ（ｎ）") == "キャッシュ (n)"
+    assert MyNormalizedString.from_str("ｷｬｯｼｭ（ｎ）") == "キャッシュ (n)"
+    assert core._normalize_jptext_cached.cache_info().hits == hits + 1
+    assert MyNormalizedString.from_str("ﾃｷｽﾄ" * 40) == "テキスト" * 40
+    assert spy.call_count == 1
+
+
+def test_json_schema_to_model_supports_primitive_arrays() -> None:
+    class MyModel(core.BaseModel):
+        numbers: Sequence[int]
+        ratios: Sequence[float]
+        flags: Sequence[bool]
+
+    generated_model = core.json_schema_to_model(MyModel.model_json_schema())
+    actual = generated_model(numbers=[1, 2], ratios=[0.5], flags=[True])
+    assert actual.model_dump() == MyModel(numbers=[1, 2], ratios=[0.5], flags=[True]).model_dump()
+    with pytest.raises(KeyError):
+        core.json_schema_to_model(
+            {"properties": {"values": {"type": "array", "items": {"type": "null"}}}, "title": "NullArray"}
+        )
+
+
+def test_numeric_validate_handles_exact_and_derived_inputs() -> None:
+    class MyInteger(core.BaseInteger): ...
+
+    class MyFloat(core.BaseFloat): ...
+
+    integer = MyInteger.validate(3)
+    assert type(integer) is MyInteger
+    assert MyInteger.validate(integer) is integer
+    assert type(MyInteger.validate(core.Timestamp(3))) is MyInteger
+    number = MyFloat.validate(0.5)
+    assert type(number) is MyFloat
+    assert MyFloat.validate(number) is number
+    with pytest.raises(ValueError):
+        MyFloat.validate(1)
+
+
+def test_bytes_id_and_timestamp_validate_handle_exact_and_derived_inputs() -> None:
+    class MyId(core.Id): ...
+
+    assert core.BaseBytes.validate(b"foo") == b"foo"
+    assert core.BaseBytes.validate("Zm9v") == b"foo"
+    my_id = MyId.generate()
+    assert core.Id.validate(my_id) is my_id
+    assert core.Id.validate(my_id.str) == my_id
+    timestamp = core.Timestamp.validate(1674397764479000)
+    assert type(timestamp) is core.Timestamp
+    assert core.Timestamp.validate(timestamp) is timestamp
+    with pytest.raises(ValueError):
+        core.Timestamp.validate(b"1")
+
+
+def test_json_schema_to_model_resolves_definitions_in_dependency_order() -> None:
+    schema: dict[str, Any] = {
+        "$defs": {
+            "Outer": {"properties": {"inner": {"$ref": "#/$defs/Inner"}}, "title": "Outer", "type": "object"},
+            "Inner": {"properties": {"leaf": {"$ref": "#/$defs/Leaf"}}, "title": "Inner", "type": "object"},
+            "Leaf": {"properties": {"name": {"type": "string"}}, "title": "Leaf", "type": "object"},
+        },
+        "properties": {"outer": {"$ref": "#/$defs/Outer"}},
+        "title": "Root",
+        "type": "object",
+    }
+    generated_model = core.json_schema_to_model(schema)
+    actual = generated_model(outer={"inner": {"leaf": {"name": "foo"}}})
+    assert actual.model_dump() == {"outer": {"inner": {"leaf": {"name": "foo"}}}}
+    assert len(schema["$defs"]) == 3
+
+
+@pytest.mark.parametrize(
+    "defs",
+    [
+        {"A": {"properties": {"b": {"$ref": "#/$defs/Missing"}}, "title": "A"}},
+        {
+            "A": {"properties": {"b": {"$ref": "#/$defs/B"}}, "title": "A"},
+            "B": {"properties": {"a": {"$ref": "#/$defs/A"}}, "title": "B"},
+        },
+    ],
+)
+def test_json_schema_to_model_rejects_unresolvable_definitions(defs: dict[str, Any]) -> None:
+    with pytest.raises(ValueError, match="Cannot resolve all references"):
+        core.json_schema_to_model({"$defs": defs, "properties": {"a": {"$ref": "#/$defs/A"}}, "title": "Root"})
+
+
+def test_regex_matched_string_check_compiles_pattern_once_per_class(mocker: MockerFixture) -> None:
+    class LowerString(core.RegexMatchedStringMixIn):
+        @classmethod
+        def get_pattern(cls) -> str:
+            return "^[a-z]+$"
+
+    class DigitString(LowerString):
+        @classmethod
+        def get_pattern(cls) -> str:
+            return "^[0-9]+$"
+
+    spy = mocker.spy(re, "compile")
+    assert LowerString.check("abc") == "abc"
+    assert LowerString.check("xyz") == "xyz"
+    with pytest.raises(ValueError) as exc_info:
+        LowerString.check("abc1")
+    assert DigitString.check("123") == "123"
+    assert spy.call_count == 2
+    assert str(exc_info.value) == "String should match pattern '^[a-z]+$'"
+
+
+def test_constructors_reuse_already_converted_values(mocker: MockerFixture) -> None:
+    class MyId(core.Id): ...
+
+    timestamp = core.Timestamp(1674397764479000)
+    assert core.Timestamp(timestamp) is timestamp
+    id_ = core.Id("01HRQ0KA867PDGYJXAVGKG3R1V")
+    assert str(id_) == "01HRQ0KA867PDGYJXAVGKG3R1V"
+    spy = mocker.spy(core, "_to_ulid_buffer")
+    derived = MyId(id_)
+    assert type(derived) is MyId
+    assert derived == id_
+    assert derived.bytes is id_.bytes
+    assert repr(derived) == "MyId('01HRQ0KA867PDGYJXAVGKG3R1V')"
+    assert spy.call_count == 0
+
+
+def test_json_schema_to_model_reuses_models_for_the_same_schema() -> None:
+    class MyBaseModel(core.BaseModel): ...
+
+    schema = {"properties": {"name": {"type": "string"}}, "title": "Cached", "type": "object"}
+    generated_model = core.json_schema_to_model(schema)
+    assert core.json_schema_to_model(dict(schema)) is generated_model
+    derived_model = core.json_schema_to_model(schema, base_model=MyBaseModel)
+    assert derived_model is not generated_model
+    assert issubclass(derived_model, MyBaseModel)
+    unserializable = {"properties": {"name": {"type": "string", "examples": {"a"}}}, "title": "Uncached"}
+    assert core.json_schema_to_model(unserializable) is not core.json_schema_to_model(unserializable)
+    assert core.json_schema_to_model(unserializable)(name="foo").model_dump() == {"name": "foo"}
+
+
+def test_update_time_aware_model_bumps_updated_at_without_revalidating(mocker: MockerFixture) -> None:
+    updates: list[Tuple[str, Any]] = []
+
+    class MyModel(core.BaseUpdateTimeAwareModel):
+        object_name: str
+
+        def on_update(self, name: str, value: Any) -> None:
+            updates.append((name, value))
+
+    dt = datetime(2024, 3, 15, 23, 31, 21, 123456, tzinfo=timezone.utc)
+    with freeze_time(dt):
+        model = MyModel.model_validate({"objectName": "foo"})
+    spy = mocker.spy(core.Timestamp, "validate")
+    dt2 = datetime(2024, 3, 15, 23, 33, 15, 123456, tzinfo=timezone.utc)
+    with freeze_time(dt2):
+        model.object_name = "bar"
+    assert spy.call_count == 0
+    assert model.updated_at == core.Timestamp(dt2)
+    assert type(model.updated_at) is core.Timestamp
+    assert "updated_at" in model.model_fields_set
+    assert updates == [("object_name", "bar"), ("updated_at", core.Timestamp(dt2))]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        core.BaseString("foo"),
+        core.BaseBytes(b"foo"),
+        core.BaseInteger(1),
+        core.BaseFloat(1.0),
+        core.Timestamp(1674397764479000),
+        core.Id("01HRQ0KA867PDGYJXAVGKG3R1V"),
+    ],
+)
+def test_scalar_types_do_not_carry_an_instance_dict(value: Any) -> None:
+    assert not hasattr(value, "__dict__")
+    assert pickle.loads(pickle.dumps(value)) == value
@@ -1,6 +1,10 @@
+from pathlib import Path
+
+import yaml
 from pydantic_settings import SettingsConfigDict
+from pytest_mock import MockerFixture
 
-from oltl import settings
+from oltl import settings, utils
 
 
 class NestedSettings(settings.BaseSettings):
@@ -54,3 +58,32 @@ def test_load_settings_with_settings_yaml(settings_yaml_path: str) -> None:
     actual = Settings.load(settings_yaml_path)
     expected = Settings(nested=NestedSettings(nested_attr="value_from_yaml", nested_numeric=3.0))
     assert actual == expected
+
+
+def test_load_settings_does_not_mutate_model_config(settings_yml_path: str, settings_yaml_path: str) -> None:
+    with utils.patch_config_value(Settings, "yaml_file", settings_yml_path):
+        assert Settings.model_config["yaml_file"] is None
+        assert utils.get_config_value(Settings, "yaml_file") == settings_yml_path
+        assert Settings.load(settings_yaml_path).nested.nested_attr == "value_from_yaml"
+        assert Settings().nested.nested_attr == "value_from_yml"
+    assert utils.get_config_value(Settings, "yaml_file") is None
+
+
+def test_load_settings_from_dotfile(settings_yaml_path: str, settings1_json_path: str, tmp_path: Path) -> None:
+    yaml_dotfile = tmp_path / ".yaml"
+    yaml_dotfile.write_bytes(Path(settings_yaml_path).read_bytes())
+    json_dotfile = tmp_path / "cfg" / ".json"
+    json_dotfile.parent.mkdir()
+    json_dotfile.write_bytes(Path(settings1_json_path).read_bytes())
+
+    assert Settings.load(str(yaml_dotfile)).nested.nested_attr == "value_from_yaml"
+    assert Settings.load(str(json_dotfile)) == Settings.load(settings1_json_path)
+
+
+def test_load_settings_parses_yaml_with_libyaml_when_available(settings_yaml_path: str, mocker: MockerFixture) -> None:
+    spy = mocker.spy(yaml, "load")
+
+    Settings.load(settings_yaml_path)
+
+    assert spy.call_count == 1
+    assert spy.call_args.kwargs["Loader"] is (yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader)
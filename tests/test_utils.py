@@ -20,6 +20,9 @@ from oltl import utils
         ["(x) (y)", "(x) (y)"],
         ["((x))", "((x))"],
         ["o(x)  (y)", "o (x)  (y)"],
+        ["a)(b", "a) (b"],
+        ["(x)y(z)", "(x) y (z)"],
+        ["plain\tascii(text)", "plain ascii (text)"],
     ],
 )
 def test_normalize_default(raw: str, expected: str) -> None: